@@ -17,6 +17,7 @@ THEIA_DEFAULT_OPTIONS = {
         "limits": {"cpu": "1.5", "memory": "750Mi"},
     },
 }
+THEIA_ASSIGNMENT_WINDOW_DAYS: int = 90
 
 # Developer IDE variables
 DEVELOPER_DEFAULT_IMAGE = "registry.digitalocean.com/anubis/theia-base"
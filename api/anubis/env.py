@@ -18,9 +18,13 @@ class EnvConfig(object):
 
         if not self.MINDEBUG:
             # sqlalchemy
-            self.SQLALCHEMY_POOL_PRE_PING = True
-            self.SQLALCHEMY_POOL_SIZE = 100
-            self.SQLALCHEMY_POOL_RECYCLE = 280
+            self.SQLALCHEMY_ENGINE_OPTIONS = {
+                "pool_size":     int(os.environ.get("DB_POOL_SIZE", default="10")),
+                "max_overflow":  int(os.environ.get("DB_MAX_OVERFLOW", default="20")),
+                "pool_timeout":  10,
+                "pool_recycle":  280,
+                "pool_pre_ping": True,
+            }
             self.SQLALCHEMY_TRACK_MODIFICATIONS = False
             self.SQLALCHEMY_DATABASE_URI = os.environ.get(
                 "DATABASE_URI",
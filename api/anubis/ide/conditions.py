@@ -1,10 +1,24 @@
+from anubis.utils.cache import cache
 from anubis.utils.config import get_config_bool
-from anubis.utils.data import req_assert
+from anubis.utils.data import is_debug, req_assert
+
+
+@cache.memoize(timeout=5, unless=is_debug)
+def theia_sessions_globally_enabled() -> bool:
+    """
+    Get the config value for if ide starts are allowed.
+
+    * Response is lightly cached. The cache is cleared when
+    config values are saved *
+
+    :return:
+    """
+    return get_config_bool("THEIA_STARTS_ENABLED", default=True)
 
 
 def assert_theia_sessions_enabled():
     # Get the config value for if ide starts are allowed.
-    theia_starts_enabled = get_config_bool("THEIA_STARTS_ENABLED", default=True)
+    theia_starts_enabled = theia_sessions_globally_enabled()
 
     # Assert that new ide starts are allowed. If they are not, then
     # we return a status message to the user saying they are not able
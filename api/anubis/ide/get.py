@@ -23,11 +23,14 @@ def get_recent_sessions(user_id: str, limit: int = 10, offset: int = 0) -> list[
     return [session.data for session in sessions]
 
 
-@cache.memoize(timeout=5, unless=is_debug)
+@cache.memoize(timeout=2, unless=is_debug)
 def get_n_available_sessions() -> tuple[int, int]:
     """
     Get the number of active sessions and the maximum number of sessions
 
+    * Response is lightly cached. The cache is cleared when sessions
+    are started or stopped *
+
     :return:
     """
     max_ides = get_config_int("THEIA_MAX_SESSIONS", default=50)
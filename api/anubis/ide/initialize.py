@@ -1,4 +1,3 @@
-import copy
 from datetime import datetime
 
 from kubernetes import config as k8s_config
@@ -8,7 +7,8 @@ from anubis.constants import (
     THEIA_DEFAULT_NETWORK_POLICY,
     THEIA_ADMIN_NETWORK_POLICY,
 )
-from anubis.lms.courses import is_course_admin
+from anubis.ide.get import get_n_available_sessions
+from anubis.lms.courses import cached_is_course_admin
 from anubis.lms.shell_autograde import create_shell_autograde_ide_submission
 from anubis.models import (
     db,
@@ -18,6 +18,7 @@ from anubis.models import (
     AssignmentRepo,
 )
 from anubis.utils.auth.user import current_user
+from anubis.utils.cache import cache
 from anubis.utils.config import get_config_int
 from anubis.utils.data import req_assert
 from anubis.utils.logging import logger
@@ -162,6 +163,9 @@ def initialize_ide(
 
     db.session.commit()
 
+    # Clear the available sessions cache now that there is a new active session
+    cache.delete_memoized(get_n_available_sessions)
+
     # Send kube resource initialization rpc job
     enqueue_ide_initialize(session.id)
 
@@ -174,7 +178,7 @@ def initialize_ide_for_assignment(user: User, assignment: Assignment, user_optio
 
     # If the user requesting this IDE is a course admin (ta/professor/superuser), then there
     # are a few places we handle things differently.
-    is_admin = is_course_admin(assignment.course_id, user.id)
+    is_admin = cached_is_course_admin(assignment.course_id, user.id)
 
     # If github repos are enabled for this assignment, then we will
     # need to get the repo url.
@@ -201,8 +205,9 @@ def initialize_ide_for_assignment(user: User, assignment: Assignment, user_optio
         # Update the repo url
         repo_url = repo.repo_url
 
-    # Create the theia options from the assignment default
-    options: dict = copy.deepcopy(assignment.theia_options)
+    # Read the theia options from the assignment default. These are only
+    # read from here on, so there is no need to deepcopy them.
+    options: dict = assignment.theia_options or {}
 
     # Figure out options from user values
     autosave = user_options.get("autosave", options.get("autosave", True))
@@ -1,4 +1,6 @@
-from anubis.models import TheiaSession
+from sqlalchemy.orm import joinedload
+
+from anubis.models import Assignment, TheiaImage, TheiaSession
 from anubis.utils.cache import cache
 from anubis.utils.data import is_debug
 
@@ -27,7 +29,42 @@ def theia_list_all(user_id: str, limit: int = 10):
     return [theia_session.data for theia_session in theia_sessions]
 
 
-#@cache.memoize(timeout=0, unless=is_debug)
+@cache.memoize(timeout=1, unless=is_debug)
+def theia_poll_session_data(theia_session_id: str) -> tuple[str, dict] | None:
+    """
+    Get the owner id and data for a theia session. This is cached
+    by session id alone, as a session only ever has one owner.
+    Ownership should be checked by the caller.
+
+    * Response is very lightly cached *
+
+    :param theia_session_id:
+    :return:
+    """
+
+    # Query for the theia session. Eager load everything session.data
+    # reads so that there are no follow-up queries.
+    theia_session: TheiaSession = (
+        TheiaSession.query.options(
+            joinedload(TheiaSession.assignment).joinedload(Assignment.course),
+            joinedload(TheiaSession.owner),
+            joinedload(TheiaSession.image).selectinload(TheiaImage.tags),
+            joinedload(TheiaSession.image_tag),
+        )
+        .filter(
+            TheiaSession.id == theia_session_id,
+        )
+        .first()
+    )
+
+    # If it was not found, then return None
+    if theia_session is None:
+        return None
+
+    # Else return the session owner and data
+    return theia_session.owner_id, theia_session.data
+
+
 def theia_poll_ide(theia_session_id: str, user_id: str) -> dict | None:
     """
     Check the status of a theia session. This is called
@@ -35,22 +72,22 @@ def theia_poll_ide(theia_session_id: str, user_id: str) -> dict | None:
     the spinner is going, this function is called until
     the session is active.
 
-    * Response is very lightly cached *
-
     :param theia_session_id:
     :param user_id:
     :return:
     """
 
-    # Query for the theia session
-    theia_session: TheiaSession = TheiaSession.query.filter(
-        TheiaSession.id == theia_session_id,
-        TheiaSession.owner_id == user_id,
-    ).first()
+    # Get the (possibly cached) session owner and data
+    session = theia_poll_session_data(theia_session_id)
 
     # If it was not found, then return None
-    if theia_session is None:
+    if session is None:
+        return None
+
+    # If the session is not owned by this user, treat it as not found
+    owner_id, data = session
+    if owner_id != user_id:
         return None
 
     # Else return the session data
-    return theia_session.data
+    return data
@@ -2,12 +2,18 @@ from werkzeug.utils import redirect
 
 from anubis.models import TheiaSession, User
 from anubis.utils.auth.token import create_token
+from anubis.utils.cache import cache
+from anubis.utils.data import is_debug
 
 
+@cache.memoize(timeout=30, unless=is_debug)
 def theia_redirect_url(theia_session_id: str, netid: str) -> str:
     """
     Generates the url for redirecting to the theia proxy for the given session.
 
+    * Response is lightly cached. The token expires in hours, so
+    handing back the same url for 30 seconds is safe *
+
     :param theia_session_id:
     :param netid:
     :return:
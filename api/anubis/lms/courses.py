@@ -6,7 +6,7 @@ import traceback
 import urllib.parse
 from typing import Any
 
-from flask import g, request
+from flask import g, has_request_context, request
 from werkzeug.local import LocalProxy
 
 from anubis.k8s.pvc.create import create_user_pvc
@@ -194,6 +194,37 @@ def is_course_admin(course_id: str, user_id: str = None) -> bool:
     return False
 
 
+def cached_is_course_admin(course_id: str, user_id: str = None) -> bool:
+    """
+    Request scoped memoization of is_course_admin. The result of each
+    (user_id, course_id) check is stored on flask's g object so that
+    repeated checks within the same request only hit the database once.
+
+    Outside a request context, this simply falls through to is_course_admin.
+
+    :param course_id:
+    :param user_id:
+    :return:
+    """
+
+    # Nothing to cache against outside a request
+    if not has_request_context():
+        return is_course_admin(course_id, user_id)
+
+    # Build cache key from the user being checked
+    key = (user_id or current_user.id, course_id)
+
+    # Get (or create) the request scoped cache
+    if "_course_admin_cache" not in g:
+        g._course_admin_cache = {}
+
+    # Only check against the database on a cache miss
+    if key not in g._course_admin_cache:
+        g._course_admin_cache[key] = is_course_admin(course_id, user_id)
+
+    return g._course_admin_cache[key]
+
+
 def assert_course_admin(course_id: str = None):
     """
     Use this function to assert that the current user is
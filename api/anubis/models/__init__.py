@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import scoped_session, deferred, relationship, InstrumentedAttribute
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 
 from anubis.constants import THEIA_DEFAULT_OPTIONS, DB_COLLATION, DB_CHARSET
 from anubis.models.enum import UserSource
@@ -65,7 +65,7 @@ class User(db.Model):
     assignment_repos = relationship("AssignmentRepo", backref="owner")
     assigned_student_questions = relationship("AssignedStudentQuestion", backref="owner")
     submissions = relationship("Submission", backref="owner")
-    theia_sessions = relationship("TheiaSession", backref="owner")
+    theia_sessions = relationship("TheiaSession", back_populates="owner")
     late_exceptions = relationship("LateException", backref="user")
     forum_posts = relationship("ForumPost", backref="owner")
     forum_comments = relationship("ForumPostComment", backref="owner", foreign_keys="ForumPostComment.owner_id")
@@ -128,7 +128,7 @@ class Course(db.Model):
     display_visuals: bool = Column(Boolean, default=True)
     beta_ui_enabled: bool = Column(Boolean, default=False)
 
-    assignments = relationship("Assignment", cascade="all,delete", backref="course")
+    assignments = relationship("Assignment", cascade="all,delete", back_populates="course")
     ta_for_course = relationship("TAForCourse", cascade="all,delete", backref="course")
     professor_for_course = relationship("ProfessorForCourse", cascade="all,delete", backref="course")
     in_course = relationship("InCourse", cascade="all,delete", backref="course")
@@ -272,11 +272,13 @@ class Assignment(db.Model):
     assignment_questions = relationship("AssignmentQuestion", cascade="all,delete", backref="assignment")
     assigned_student_questions = relationship("AssignedStudentQuestion", cascade="all,delete", backref="assignment")
     submissions = relationship("Submission", cascade="all,delete", backref="assignment")
-    theia_sessions = relationship("TheiaSession", cascade="all,delete", backref="assignment")
+    theia_sessions = relationship("TheiaSession", cascade="all,delete", back_populates="assignment")
     late_exceptions = relationship("LateException", cascade="all,delete", backref="assignment")
     tests = relationship("AssignmentTest", cascade="all,delete", backref="assignment")
-    repos = relationship("AssignmentRepo", cascade="all,delete", backref="assignment")
+    repos = relationship("AssignmentRepo", cascade="all,delete", back_populates="assignment")
     reserved_ide_times = relationship("ReservedIDETime", cascade="all,delete", backref="assignment")
+    course = relationship("Course", back_populates="assignments")
+    theia_image = relationship("TheiaImage", back_populates="assignments")
 
     def __repr__(self):
         name = self.name
@@ -343,6 +345,8 @@ class AssignmentRepo(db.Model):
     created: datetime = Column(DateTime, default=datetime.now)
     last_updated: datetime = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
+    assignment = relationship(Assignment, back_populates="repos")
+
     @property
     def data(self):
         return {
@@ -692,8 +696,8 @@ class TheiaImage(db.Model):
     webtop: bool = Column(Boolean, default=False)
 
     courses = relationship(Course, backref="theia_default_image")
-    assignments = relationship(Assignment, backref="theia_image")
-    sessions = relationship("TheiaSession", backref="image")
+    assignments = relationship(Assignment, back_populates="theia_image")
+    sessions = relationship("TheiaSession", back_populates="image")
     tags = relationship("TheiaImageTag", backref="image")
 
     @property
@@ -744,7 +748,11 @@ class TheiaImageTag(db.Model):
 class TheiaSession(db.Model):
     __tablename__ = "theia_session"
     __allow_unmapped__ = True
-    __table_args__ = {"mysql_charset": DB_CHARSET, "mysql_collate": DB_COLLATION}
+    __table_args__ = (
+        Index("ix_theia_session_owner_active_assign", "owner_id", "active", "assignment_id"),
+        Index("ix_theia_session_owner_created", "owner_id", "created"),
+        {"mysql_charset": DB_CHARSET, "mysql_collate": DB_COLLATION},
+    )
 
     # id
     id = default_id()
@@ -783,6 +791,10 @@ class TheiaSession(db.Model):
     last_proxy: datetime = Column(DateTime, default=datetime.now)
     last_updated: datetime = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
+    owner = relationship(User, back_populates="theia_sessions")
+    assignment = relationship(Assignment, back_populates="theia_sessions")
+    image = relationship(TheiaImage, back_populates="sessions")
+
     @property
     def data(self):
         from anubis.ide.redirect import theia_redirect_url
@@ -2,9 +2,9 @@ import functools
 import urllib.parse
 from datetime import datetime, timedelta
 from hashlib import sha512
-from json import dumps
 from os import urandom
 
+import orjson
 from flask import Response, has_app_context, has_request_context
 
 from anubis.env import env
@@ -32,11 +32,25 @@ def is_job() -> bool:
     return env.JOB
 
 
+def _json_default(obj):
+    """
+    Fallback for types that the stdlib json module accepted, but
+    orjson does not serialize natively (float subclasses).
+    """
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def jsonify(data, status_code=200):
     """
     Wrap a data response to set proper headers for json
     """
-    res = Response(dumps(data))
+    res = Response(orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    ))
     res.status_code = status_code
     res.headers["Content-Type"] = "application/json"
     return res
@@ -8,7 +8,7 @@ from anubis.utils.exceptions import AuthenticationError
 from anubis.utils.http import error_response
 
 
-def load_from_id(model, verify_owner=False):
+def load_from_id(model, verify_owner=False, loader_options=None):
     """
     This flask decorator loads the id kwarg passed in by flask
     and uses it to pull the sqlalchemy object corresponding to that id
@@ -23,8 +23,15 @@ def load_from_id(model, verify_owner=False):
     relationship (assuming it has one) will be checked against the
     current logged in user.
 
+    The loader_options are passed to the query as sqlalchemy loader
+    options. Use these to eager load relationships that the view
+    function is known to access.
+
+    >>> @load_from_id(Assignment, loader_options=[joinedload(Assignment.course)])
+
     :param model:
     :param verify_owner:
+    :param loader_options:
     :return:
     """
 
@@ -33,7 +40,10 @@ def load_from_id(model, verify_owner=False):
         def decorator(id, *args, **kwargs):
             # Use the id from the view functions params to query for
             # the object.
-            r = model.query.filter_by(id=id).first()
+            query = model.query
+            if loader_options:
+                query = query.options(*loader_options)
+            r = query.filter_by(id=id).first()
 
             # If the sqlalchemy object was not found, then return a 400
             if r is None:
@@ -4,6 +4,7 @@ from datetime import datetime
 from flask import Blueprint
 
 from anubis.constants import THEIA_ADMIN_NETWORK_POLICY
+from anubis.ide.conditions import assert_theia_sessions_enabled
 from anubis.ide.initialize import initialize_ide
 from anubis.k8s.theia.reap import reap_theia_sessions_in_course
 from anubis.lms.courses import course_context
@@ -11,7 +12,6 @@ from anubis.models import TheiaSession, TheiaImage, db
 from anubis.rpc.enqueue import rpc_enqueue, enqueue_ide_stop
 from anubis.utils.auth.http import require_admin
 from anubis.utils.auth.user import current_user
-from anubis.utils.config import get_config_bool
 from anubis.utils.data import req_assert
 from anubis.utils.http import error_response, success_response
 from anubis.utils.http.decorators import json_endpoint, json_response
@@ -103,16 +103,10 @@ def admin_ide_initialize_custom(settings: dict, **_):
     except json.JSONDecodeError:
         return error_response("Can not parse JSON options")
 
-    # Get the config value for if ide starts are allowed.
-    theia_starts_enabled = get_config_bool("THEIA_STARTS_ENABLED", default=True)
-
     # Assert that new ide starts are allowed. If they are not, then
     # we return a status message to the user saying they are not able
     # to start a new ide.
-    req_assert(
-        theia_starts_enabled,
-        message="Starting new IDEs is currently disabled by an Anubis administrator. " "Please try again later.",
-    )
+    assert_theia_sessions_enabled()
 
     session: TheiaSession = initialize_ide(
         image_id=image.id,
@@ -1,29 +1,50 @@
 from datetime import datetime, timedelta
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, after_this_request, current_app, request
+from sqlalchemy.orm import joinedload
 
+from anubis.constants import THEIA_ASSIGNMENT_WINDOW_DAYS
 from anubis.ide.conditions import assert_theia_sessions_enabled
 from anubis.ide.get import get_n_available_sessions
 from anubis.ide.initialize import initialize_ide_for_assignment
-from anubis.ide.poll import theia_poll_ide
+from anubis.ide.poll import theia_poll_ide, theia_poll_session_data
 from anubis.ide.redirect import theia_redirect_url
 from anubis.lms.assignments import get_assignment_due_date
-from anubis.lms.courses import is_course_admin
-from anubis.models import Assignment, TheiaSession, db
+from anubis.lms.courses import cached_is_course_admin
+from anubis.models import Assignment, TheiaImage, TheiaSession, db
 from anubis.rpc.enqueue import enqueue_ide_stop
 from anubis.utils.auth.http import require_user
 from anubis.utils.auth.user import current_user
 from anubis.utils.cache import cache
-from anubis.utils.data import req_assert
+from anubis.utils.data import is_debug, jsonify, req_assert
 from anubis.utils.http import error_response, success_response
 from anubis.utils.http.decorators import json_response, load_from_id
 
 ide_ = Blueprint("public-ide", __name__, url_prefix="/public/ide")
 
+# Session states where the session is no longer loading
+_LOADING_TERMINAL = frozenset({"Running", "Ended", "Failed"})
+
+# Map of session state code to the status message that should
+# be displayed on the frontend.
+_POLL_STATUS = {
+    "Running": ("Session is now ready.", "success"),
+    # "Ended": ("Session ended.", "warning"),
+    "Failed":  ("Session failed to start. Please try again.", "error"),
+}
+
+
+def _poll_cache_key(theia_session_id: str, user_id: str) -> str:
+    return f"poll:{theia_session_id}:{user_id}"
+
 
 @ide_.post("/initialize/<string:id>")
 @require_user()
-@load_from_id(Assignment, verify_owner=False)
+@load_from_id(
+    Assignment,
+    verify_owner=False,
+    loader_options=[joinedload(Assignment.course), joinedload(Assignment.theia_image)],
+)
 @json_response
 def public_ide_initialize(assignment: Assignment):
     """
@@ -36,16 +57,13 @@ def public_ide_initialize(assignment: Assignment):
     # verify that ides are enabled for this assignment
     req_assert(assignment.ide_enabled, message="IDEs are not enabled for this assignment")
 
-    # Check for existing active session
-    active_session = (
-        TheiaSession.query.join(Assignment)
-        .filter(
-            TheiaSession.owner_id == current_user.id,
-            TheiaSession.assignment_id == assignment.id,
-            TheiaSession.active,
-        )
-        .first()
-    )
+    # Check for existing active session. The assignment is already loaded,
+    # so there is no need to join against it here.
+    active_session = TheiaSession.query.filter(
+        TheiaSession.owner_id == current_user.id,
+        TheiaSession.assignment_id == assignment.id,
+        TheiaSession.active,
+    ).first()
 
     # If there was an existing session for this assignment found, skip
     # the initialization, and return the active session information.
@@ -59,7 +77,7 @@ def public_ide_initialize(assignment: Assignment):
 
     # If the user requesting this IDE is a course admin (ta/professor/superuser), then there
     # are a few places we handle things differently.
-    is_admin = is_course_admin(assignment.course_id)
+    is_admin = cached_is_course_admin(assignment.course_id)
 
     # If it is a student (not a ta) requesting the ide, then we will need to
     # make sure that the assignment has actually been released.
@@ -75,10 +93,13 @@ def public_ide_initialize(assignment: Assignment):
         # In that case, this function will pull the proper datetime.
         due_date = get_assignment_due_date(current_user.id, assignment.id, grace=True)
 
-        # If 90 days has passed since the assignment has been due, then we should not allow
+        # If the window has passed since the assignment has been due, then we should not allow
         # new sessions to be created
-        if due_date + timedelta(days=90) <= datetime.now():
-            return error_response("Assignment due date passed over 90 days ago. IDEs are no longer available.")
+        if due_date + timedelta(days=THEIA_ASSIGNMENT_WINDOW_DAYS) <= datetime.now():
+            return error_response(
+                f"Assignment due date passed over {THEIA_ASSIGNMENT_WINDOW_DAYS} days ago. "
+                "IDEs are no longer available."
+            )
 
     user_options = dict()
     if request.is_json:
@@ -133,12 +154,22 @@ def public_ide_active(assignment_id):
     :return:
     """
 
-    # Find if they have an active session for this assignment
-    session = TheiaSession.query.filter(
-        TheiaSession.active,
-        TheiaSession.owner_id == current_user.id,
-        TheiaSession.assignment_id == assignment_id,
-    ).first()
+    # Find if they have an active session for this assignment. Eager load
+    # everything session.data reads so that there are no follow-up queries.
+    session = (
+        TheiaSession.query.options(
+            joinedload(TheiaSession.assignment).joinedload(Assignment.course),
+            joinedload(TheiaSession.owner),
+            joinedload(TheiaSession.image).selectinload(TheiaImage.tags),
+            joinedload(TheiaSession.image_tag),
+        )
+        .filter(
+            TheiaSession.active,
+            TheiaSession.owner_id == current_user.id,
+            TheiaSession.assignment_id == assignment_id,
+        )
+        .first()
+    )
 
     # If they do not have an active assignment, then pass back False
     if session is None:
@@ -165,28 +196,47 @@ def public_ide_stop(theia_session_id: str) -> dict[str, str]:
     :return:
     """
 
-    # Find the theia session
-    theia_session: TheiaSession = TheiaSession.query.filter(
+    # Mark the session as stopped. This is done in a single update
+    # statement so we do not need to load the session first.
+    updated: int = TheiaSession.query.filter(
         TheiaSession.id == theia_session_id,
         TheiaSession.owner_id == current_user.id,
-    ).first()
+    ).update({
+        "active": False,
+        "ended":  datetime.now(),
+        "state":  "Ended",
+    }, synchronize_session=False)
 
     # Verify that the session exists
-    req_assert(theia_session is not None, message="session does not exist")
-
-    # Mark the session as stopped.
-    theia_session.active = False
-    theia_session.ended = datetime.now()
-    theia_session.state = "Ended"
+    req_assert(updated == 1, message="session does not exist")
 
     # Commit the change
     db.session.commit()
 
-    # Enqueue a ide stop job
-    enqueue_ide_stop(theia_session.id)
+    # The cleanup below runs after the response has been sent, so pull
+    # out what it needs while we still have the request context.
+    app = current_app._get_current_object()
+    user_id, netid = current_user.id, current_user.netid
+
+    def _cleanup():
+        with app.app_context():
+            # Enqueue a ide stop job
+            enqueue_ide_stop(theia_session_id)
 
-    # Clear poll cache
-    # cache.delete_memoized(theia_poll_ide, theia_session_id, current_user.id)
+            # Clear poll cache
+            cache.delete_memoized(theia_poll_session_data, theia_session_id)
+            cache.delete(_poll_cache_key(theia_session_id, user_id))
+
+            # Clear the available sessions cache now that this session is stopped
+            cache.delete_memoized(get_n_available_sessions)
+
+            # Clear the cached redirect url for this session
+            cache.delete_memoized(theia_redirect_url, theia_session_id, netid)
+
+    @after_this_request
+    def _defer_cleanup(response: Response) -> Response:
+        response.call_on_close(_cleanup)
+        return response
 
     # Pass back the status
     return success_response(
@@ -199,15 +249,22 @@ def public_ide_stop(theia_session_id: str) -> dict[str, str]:
 
 @ide_.route("/poll/<string:theia_session_id>")
 @require_user()
-@json_response
-def public_ide_poll(theia_session_id: str) -> dict[str, str]:
+def public_ide_poll(theia_session_id: str) -> Response:
     """
-    Slightly cached endpoint for polling for session data.
+    Slightly cached endpoint for polling for session data. The
+    serialized response body is cached for a couple of seconds
+    so repeated polls skip building the response entirely.
 
     :param theia_session_id:
     :return:
     """
 
+    # If there is a cached response body for this session and user, pass it back as is
+    cache_key = _poll_cache_key(theia_session_id, current_user.id)
+    body = cache.get(cache_key) if not is_debug() else None
+    if body is not None:
+        return Response(body, mimetype="application/json")
+
     # Find the (possibly cached) session data
     session_data = theia_poll_ide(theia_session_id, current_user.id)
 
@@ -216,25 +273,27 @@ def public_ide_poll(theia_session_id: str) -> dict[str, str]:
 
     # Check to see if it is still initializing
     session_state = session_data["state"]
-    loading = session_state not in {"Running", "Ended", "Failed"}
+    loading = session_state not in _LOADING_TERMINAL
 
-    # Map of session state code to the status message that should
-    # be displayed on the frontend.
-    status, variant = {
-        "Running": ("Session is now ready.", "success"),
-        # "Ended": ("Session ended.", "warning"),
-        "Failed":  ("Session failed to start. Please try again.", "error"),
-    }.get(session_state, (None, None))
+    # Get the status message that should be displayed on the frontend
+    status, variant = _POLL_STATUS.get(session_state, (None, None))
 
-    # Pass back the status and data
-    return success_response(
+    # Build the status and data response
+    response = jsonify(success_response(
         {
             "loading": loading,
             "session": session_data,
             "status":  status,
             "variant": variant,
         }
-    )
+    ))
+
+    # Cache the serialized body for the next poll
+    if not is_debug():
+        cache.set(cache_key, response.get_data(), timeout=2)
+
+    # Pass back the status and data
+    return response
 
 
 @ide_.route("/redirect-url/<string:theia_session_id>")
@@ -248,14 +307,17 @@ def public_ide_redirect_url(theia_session_id: str) -> dict[str, str]:
     :return:
     """
 
-    # Search for session
-    theia_session: TheiaSession = TheiaSession.query.filter(
-        TheiaSession.id == theia_session_id,
-        TheiaSession.owner_id == current_user.id,
-    ).first()
+    # Check that the session exists and is owned by the current user. We
+    # only need to know that it is there, so the row is never loaded.
+    owned: bool = db.session.query(
+        TheiaSession.query.filter(
+            TheiaSession.id == theia_session_id,
+            TheiaSession.owner_id == current_user.id,
+        ).exists()
+    ).scalar()
 
     # Verify that the session exists
-    req_assert(theia_session is not None, message="session does not exist")
+    req_assert(owned, message="session does not exist")
 
     # Pass back redirect link
-    return success_response({"redirect": theia_redirect_url(theia_session.id, current_user.netid)})
+    return success_response({"redirect": theia_redirect_url(theia_session_id, current_user.netid)})
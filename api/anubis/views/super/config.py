@@ -1,7 +1,10 @@
 from flask import Blueprint
 
+from anubis.ide.conditions import theia_sessions_globally_enabled
 from anubis.models import Config, db
 from anubis.utils.auth.http import require_superuser
+from anubis.utils.cache import cache
+from anubis.utils.config import get_config_bool, get_config_dict, get_config_int, get_config_str
 from anubis.utils.http import success_response, req_assert
 from anubis.utils.http.decorators import json_endpoint, json_response
 
@@ -66,6 +69,13 @@ def config_add(config, **_):
     # Commit the changes
     db.session.commit()
 
+    # Clear the cached config values so the change takes effect immediately
+    cache.delete_memoized(get_config_str)
+    cache.delete_memoized(get_config_int)
+    cache.delete_memoized(get_config_bool)
+    cache.delete_memoized(get_config_dict)
+    cache.delete_memoized(theia_sessions_globally_enabled)
+
     items = Config.query.all()
     return success_response(
         {
@@ -29,8 +29,7 @@ def upgrade():
     )
     conn = op.get_bind()
     with conn.begin():
-        conn.execute("UPDATE theia_image SET `title` = `label`;")
-        conn.execute("UPDATE theia_image SET `description` = `label`;")
+        conn.execute("UPDATE theia_image SET `title` = `label`, `description` = `label`;")
     op.drop_column("theia_image", "label")
     # ### end Alembic commands ###
 
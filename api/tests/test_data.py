@@ -1,6 +1,9 @@
+import json
+
+import numpy as np
 import pytest
 
-from anubis.utils.data import verify_data_shape
+from anubis.utils.data import jsonify, verify_data_shape
 
 
 @pytest.mark.parametrize("students", [
@@ -32,3 +35,18 @@ def test_verify_shape_students_fail(students, error):
     passed, error_msg = verify_data_shape(students, [{"netid": str, "name": str}])
     assert not passed
     assert error_msg == error
+
+
+class _Float(float):
+    pass
+
+
+@pytest.mark.parametrize("data", [
+    {"x": np.abs(np.float64(-1.5)), "y": np.int64(2), "size": 3},
+    {"x": _Float(1.5), 1: "a"},
+    [{"a": None, "b": [1, 2.5, "c"]}],
+])
+def test_jsonify_matches_stdlib(data):
+    response = jsonify(data)
+    assert response.headers["Content-Type"] == "application/json"
+    assert json.loads(response.get_data()) == json.loads(json.dumps(data, default=lambda o: o.item()))
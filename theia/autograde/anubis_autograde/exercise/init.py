@@ -1,15 +1,33 @@
 import argparse
+import importlib.util
 import traceback
-import sys
+import typing
 import os
+from types import ModuleType
 
 from anubis_autograde.exercise.get import set_exercises
 from anubis_autograde.logging import log
 
-_module_name: str = None
+_module_path: str = None
+_modules: typing.Dict[str, ModuleType] = {}
+
+
+def load_exercise_module(module_path: str) -> ModuleType:
+    module_path = os.path.abspath(module_path)
+    if module_path in _modules:
+        return _modules[module_path]
+
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    _modules[module_path] = module
+    return module
+
 
 def get_exercise_module():
-    return __import__(_module_name)
+    return load_exercise_module(_module_path)
 
 
 def call_exercise_init():
@@ -23,15 +41,12 @@ def call_exercise_init():
 
 
 def init_exercises(args: argparse.Namespace):
-    global _module_name
+    global _module_path
 
     try:
-        module_path = args.exercise_module[:-3] if args.exercise_module.endswith('.py') else args.exercise_module
-        module_directory = os.path.dirname(module_path)
-        module_name = os.path.basename(module_path)
-        sys.path.append(module_directory)
-        _module_name = module_name
-        exercise_module = __import__(module_name)
+        module_path = args.exercise_module if args.exercise_module.endswith('.py') else args.exercise_module + '.py'
+        exercise_module = load_exercise_module(module_path)
+        _module_path = module_path
     except Exception as e:
         log.error(traceback.format_exc())
         log.error(f'Failed to import exercise module e={e}')
@@ -56,15 +71,13 @@ def init_exercises(args: argparse.Namespace):
     if resume:
         log.info(f'resume = {resume}')
 
-        contains_resume = any(exercise.name == resume for exercise in exercises)
-        if not contains_resume:
+        resume_index = next((index for index, exercise in enumerate(exercises) if exercise.name == resume), None)
+        if resume_index is None:
             log.warning(f'loaded exercises does not contain resume={resume}. resetting to beginning.')
             return
 
-        for exercise in exercises:
+        for exercise in exercises[:resume_index + 1]:
             exercise.complete = True
-            if exercise.name == resume:
-                break
 
     else:
         # If not resume, then call exercise init function
@@ -1,3 +1,7 @@
+from anubis_autograde.exercise.get import get_exercises
+from anubis_autograde.exercise.init import init_exercises
+
+
 class TestExerciseGenerate:
 
     def test_exercise_py_gen(self, exercise_py):
@@ -17,3 +21,13 @@ class TestExerciseGenerate:
         assert exercise.exercises[1].name == 'mkdir exercise1'
         assert exercise.exercises[2].name == 'cd exercise1'
         assert exercise.exercises[3].name == 'pipe hello world'
+
+    def test_exercise_resume(self, parser, exercise_py):
+        args = parser.parse_args(['server', '--resume', 'mkdir exercise1', str(exercise_py)])
+        init_exercises(args)
+        assert [exercise.complete for exercise in get_exercises()] == [True, True, False, False]
+
+    def test_exercise_resume_missing(self, parser, exercise_py):
+        args = parser.parse_args(['server', '--resume', 'not an exercise', str(exercise_py)])
+        init_exercises(args)
+        assert not any(exercise.complete for exercise in get_exercises())